@@ -33,6 +33,7 @@ from enum import Enum
 from decimal import Decimal
 from flask import Flask
 from flask_sqlalchemy import SQLAlchemy
+from sqlalchemy import bindparam, select, text
 
 logger = logging.getLogger("flask.app")
 
@@ -155,6 +156,27 @@ class Product(db.Model):
     # CLASS METHODS
     ##################################################
 
+    # Cache of the SELECT statements behind the find_by_* methods so the
+    # expression tree is built once instead of on every call
+    _statement_cache: dict = {}
+
+    @classmethod
+    def _select_by(cls, field: str):
+        """Returns a cached SELECT statement filtered on the given column
+
+        :param field: the name of the column to filter on
+        :type field: str
+
+        :return: a SELECT statement with a bind parameter named after the column
+        :rtype: Select
+
+        """
+        statement = cls._statement_cache.get(field)
+        if statement is None:
+            statement = select(cls).where(getattr(cls, field) == bindparam(field))
+            cls._statement_cache[field] = statement
+        return statement
+
     @classmethod
     def init_db(cls, app: Flask):
         """Initializes the database session
@@ -168,6 +190,11 @@ class Product(db.Model):
         db.init_app(app)
         app.app_context().push()
         db.create_all()  # make our sqlalchemy tables
+        if app.config.get("TESTING") and db.engine.dialect.name == "postgresql":
+            # test data doesn't need crash durability; an UNLOGGED table
+            # skips the WAL writes that dominate the cost of each commit
+            with db.engine.begin() as connection:
+                connection.execute(text("ALTER TABLE product SET UNLOGGED"))
 
     @classmethod
     def all(cls) -> list:
@@ -201,7 +228,7 @@ class Product(db.Model):
 
         """
         logger.info("Processing name query for %s ...", name)
-        return cls.query.filter(cls.name == name)
+        return db.session.scalars(cls._select_by("name"), {"name": name})
 
     @classmethod
     def find_by_price(cls, price: Decimal) -> list:
@@ -218,7 +245,7 @@ class Product(db.Model):
         price_value = price
         if isinstance(price, str):
             price_value = Decimal(price.strip(' "'))
-        return cls.query.filter(cls.price == price_value)
+        return db.session.scalars(cls._select_by("price"), {"price": price_value})
 
     @classmethod
     def find_by_availability(cls, available: bool = True) -> list:
@@ -232,7 +259,7 @@ class Product(db.Model):
 
         """
         logger.info("Processing available query for %s ...", available)
-        return cls.query.filter(cls.available == available)
+        return db.session.scalars(cls._select_by("available"), {"available": available})
 
     @classmethod
     def find_by_category(cls, category: Category = Category.UNKNOWN) -> list:
@@ -246,4 +273,4 @@ class Product(db.Model):
 
         """
         logger.info("Processing category query for %s ...", category.name)
-        return cls.query.filter(cls.category == category)
+        return db.session.scalars(cls._select_by("category"), {"category": category})
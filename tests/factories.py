@@ -18,9 +18,16 @@
 Test Factory to make fake objects for testing
 """
 import factory
+from factory import random as factory_random
 from factory.fuzzy import FuzzyChoice, FuzzyDecimal
 from service.models import Product, Category
 
+# Seed once at import so factory data is deterministic across runs, and
+# warm the default Faker so its provider setup is paid here rather than
+# inside the first test that builds a product
+factory_random.reseed_random("service/products")
+factory.Faker._get_faker()  # pylint: disable=protected-access
+
 
 class ProductFactory(factory.Factory):
     """Creates fake products for testing"""